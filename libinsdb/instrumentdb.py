@@ -1,12 +1,60 @@
 # -*- encoding: utf-8 -*-
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
-from typing import Union, IO
+from datetime import datetime
+from typing import Iterable, Union, IO
 from uuid import UUID
 
+from dateutil import parser
+
 from .objects import FormatSpecification, Entity, Quantity, DataFile, Release
 
+# This matches the same textual forms accepted by `uuid.UUID`
+_UUID_REGEX = re.compile(
+    r"(?:urn:)?(?:uuid:)?\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?"
+    r"[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\}?"
+)
+
+# Methods used by `InstrumentDatabase.query` to retrieve the objects whose
+# path is "/KIND/UUID", with KIND being one of the keys. Data files are
+# handled separately, as they can be tracked
+_QUERY_METHOD_NAMES = {
+    "quantities": "query_quantity",
+    "entities": "query_entity",
+    "format_specs": "query_format_spec",
+}
+
+
+def looks_like_uuid(identifier: str) -> bool:
+    """Return ``True`` if `identifier` can be converted into a ``uuid.UUID``
+
+    This is much faster than calling ``UUID(identifier)`` and catching
+    ``ValueError`` when `identifier` is a path.
+    """
+
+    return _UUID_REGEX.fullmatch(identifier) is not None
+
+
+def parse_iso8601(date: str) -> datetime:
+    """Convert a date/time in ISO 8601 format into a ``datetime`` object
+
+    This uses ``datetime.fromisoformat``, which is much faster than
+    ``dateutil.parser.isoparse``. The latter is used as a fallback for
+    the formats that ``datetime.fromisoformat`` does not understand
+    (older Python versions accept only a subset of ISO 8601).
+    """
+
+    # Before Python 3.11, `fromisoformat` does not accept "Z" for UTC
+    if date.endswith("Z"):
+        date = date[:-1] + "+00:00"
+
+    try:
+        return datetime.fromisoformat(date)
+    except ValueError:
+        return parser.isoparse(date)
+
 
 class InstrumentDatabase(ABC):
     """An abstract class representing a local/remote database
@@ -59,6 +107,24 @@ class InstrumentDatabase(ABC):
         """
         raise NotImplementedError()
 
+    def query_data_files(
+        self, identifiers: Iterable[Union[str, UUID]], track: bool = True
+    ) -> list[DataFile]:
+        """Retrieve several data files at once
+
+        Each element in `identifiers` can be any of the values accepted by
+        :meth:`.query_data_file`. The data files are returned in a list,
+        in the same order as `identifiers`. This is handy to retrieve
+        all the data files belonging to a quantity::
+
+            quantity = insdb.query_quantity("/LFI/frequency_030_ghz/27M/bandpass")
+            data_files = insdb.query_data_files(quantity.data_files)
+
+        Derived classes can override this method to retrieve the data
+        files more efficiently than one at a time.
+        """
+        return [self.query_data_file(x, track=track) for x in identifiers]
+
     @abstractmethod
     def query_release(self, tag: str) -> Release:
         """Retrieve a release"""
@@ -91,24 +157,41 @@ class InstrumentDatabase(ABC):
 
         """
         if isinstance(identifier, UUID):
-            return self.query_data_file(identifier)
-
-        for obj_type_name, method_to_call in [
-            ("/data_files", lambda uuid: self.query_data_file(uuid, track=track)),
-            ("/quantities", self.query_quantity),
-            ("/entities", self.query_entity),
-            ("/format_specs", self.query_format_spec),
-        ]:
-            if identifier.startswith(obj_type_name):
-                uuid = UUID(identifier.split("/")[-1])
-                return method_to_call(uuid)  # type: ignore
-
-        if identifier.startswith("/releases"):
-            # Drop the "/releases/" and go on
-            identifier = identifier[len("/releases/") :]
+            return self.query_data_file(identifier, track=track)
+
+        if identifier.startswith("/"):
+            # Split "/KIND/REST" into "KIND" and "REST"
+            kind, _, rest = identifier[1:].partition("/")
+
+            if kind == "data_files":
+                return self.query_data_file(UUID(rest), track=track)
+
+            method_name = _QUERY_METHOD_NAMES.get(kind)
+            if method_name is not None:
+                return getattr(self, method_name)(UUID(rest))
+
+            if kind == "releases":
+                # Drop the "/releases/" and go on
+                identifier = rest
 
         # Assume that "identifier" is a release name
-        return self.query_data_file(identifier)
+        return self.query_data_file(identifier, track=track)
+
+    def query_many(
+        self,
+        identifiers: Iterable[Union[str, UUID]],
+        track: bool = True,
+    ) -> list[Union[DataFile, Quantity, Entity, FormatSpecification]]:
+        """Query several objects from the database
+
+        Each element in `identifiers` can be any of the values accepted by
+        :meth:`.query`, and different kinds of objects can be mixed. The
+        objects are returned in a list, in the same order as `identifiers`.
+
+        Derived classes can override this method to retrieve the objects
+        more efficiently than one at a time.
+        """
+        return [self.query(x, track=track) for x in identifiers]
 
     @abstractmethod
     def open_data_file(self, data_file: DataFile) -> IO:
@@ -4,30 +4,37 @@
 from __future__ import annotations
 
 import json
+import os
+import pickle
+import sys
+import tempfile
 import yaml
 import gzip
 from pathlib import Path
 from typing import Any, Union, IO
 from uuid import UUID
 
-from dateutil import parser
-
 from .objects import FormatSpecification, Entity, Quantity, DataFile, Release
-from .instrumentdb import InstrumentDatabase
+from .instrumentdb import InstrumentDatabase, looks_like_uuid, parse_iso8601
+
+# The C loader is available only if PyYAML was built against libyaml,
+# but it is much faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def _read_json(path: Path):
     try:
-        with path.open("rt") as inpf:
-            return json.load(inpf)
+        # Decoding the bytes directly is faster than reading text
+        with path.open("rb") as inpf:
+            return json.loads(inpf.read())
     except json.JSONDecodeError as err:
         raise InstrumentDbFormatError(f"Invalid JSON schema: {err}")
 
 
 def _read_json_gz(path: Path):
     try:
-        with gzip.open(path, "rt") as inpf:
-            return json.load(inpf)
+        with gzip.open(path, "rb") as inpf:
+            return json.loads(inpf.read())
     except json.JSONDecodeError as err:
         raise InstrumentDbFormatError(f"Invalid gzipped JSON schema: {err}")
     except gzip.BadGzipFile as err:
@@ -39,7 +46,7 @@ def _read_yaml(path: Path):
 
     try:
         with path.open("rt") as inpf:
-            return yaml.safe_load(inpf)
+            return yaml.load(inpf, Loader=_YAML_LOADER)
     except ScannerError as err:
         raise InstrumentDbFormatError(f"Invalid YAML schema: {err}")
 
@@ -49,7 +56,7 @@ def _read_yaml_gz(path: Path):
 
     try:
         with gzip.open(path, "rt") as inpf:
-            return yaml.safe_load(inpf)
+            return yaml.load(inpf, Loader=_YAML_LOADER)
     except ScannerError as err:
         raise InstrumentDbFormatError(f"Invalid YAML schema: {err}")
     except gzip.BadGzipFile as err:
@@ -68,60 +75,106 @@ _DB_FLATFILE_FORMAT_SPEC_DIR_NAME = "format_spec"
 _DB_FLATFILE_PLOT_FILES_DIR_NAME = "plot_files"
 _DB_FLATFILE_RELEASE_DOCUMENT_DIR_NAME = "release_documents"
 
+# Increase this whenever the layout of the objects saved in the schema cache changes
+_SCHEMA_CACHE_VERSION = 6
+
+# Attributes of `LocalInsDb` that are filled by `LocalInsDb.parse_schema`
+_PARSED_SCHEMA_ATTRIBUTES = [
+    "format_specs",
+    "entities",
+    "quantities",
+    "data_files",
+    "releases",
+    "path_to_entity",
+    "path_to_quantity",
+    "release_quantity_to_data_file",
+]
+
+
+def _schema_cache_key(schema_file_path: Path, storage_path: Path) -> tuple[Any, ...]:
+    """Return a tuple that changes whenever the schema file is modified
+
+    The key includes `storage_path` as given by the user, because the
+    paths to the data files are built from it and might be relative.
+
+    Raise ``FileNotFoundError`` if the schema file does not exist.
+    """
+    stat = schema_file_path.stat()
+    return (
+        _SCHEMA_CACHE_VERSION,
+        str(schema_file_path.absolute()),
+        str(storage_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+def _intern(value: Any) -> Any:
+    """Return a shared copy of `value` if it is a string
+
+    Fields like MIME types or version numbers take only a handful of
+    distinct values across the whole schema, so there is no need to
+    keep one copy of them for every object.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
 
-def _parse_format_spec(obj_dict: dict[str, Any]) -> FormatSpecification:
-    if "doc_file_name" in obj_dict:
-        doc_file_name = Path(obj_dict["doc_file_name"])
-    else:
-        doc_file_name = None
 
+def _parse_format_spec(obj_dict: dict[str, Any]) -> FormatSpecification:
     return FormatSpecification(
         uuid=UUID(obj_dict["uuid"]),
         document_ref=obj_dict.get("document_ref", ""),
         title=obj_dict.get("title", ""),
-        local_doc_file_path=doc_file_name,
-        doc_mime_type=obj_dict.get("doc_mime_type", ""),
-        file_mime_type=obj_dict.get("file_mime_type", ""),
-    )
-
-
-def _parse_entity(
-    obj_dict: dict[str, Any], base_path="", parent: UUID | None = None
-) -> tuple[Entity, list[dict[str, Any]]]:
-    name = obj_dict["name"]
-    return (
-        Entity(
-            uuid=UUID(obj_dict["uuid"]),
-            name=name,
-            full_path=f"{base_path}/{name}",
-            parent=parent,
-        ),
-        obj_dict.get("children", []),
+        local_doc_file_path=obj_dict.get("doc_file_name", None),
+        doc_mime_type=_intern(obj_dict.get("doc_mime_type", "")),
+        file_mime_type=_intern(obj_dict.get("file_mime_type", "")),
     )
 
 
 def _walk_entity_tree_and_parse(
     dictionary: dict[UUID, Any],
+    path_to_entity: dict[str, UUID],
     objs: list[dict[str, Any]],
     base_path: str = "",
     parent: UUID | None = None,
 ):
-    for obj_dict in objs:
-        obj, children = _parse_entity(
-            obj_dict=obj_dict,
-            base_path=base_path,
-            parent=parent,
+    # We use an explicit stack instead of recursion, so that deep trees do
+    # not hit Python's recursion limit. Children are pushed in reverse order
+    # so that entities are visited in the same order as they appear in the
+    # schema. Each element holds the path of the parent entity, so that
+    # every path is built only once
+    stack = [
+        (obj_dict, base_path, parent) for obj_dict in reversed(objs)
+    ]  # type: list[tuple[dict[str, Any], str, UUID | None]]
+    children_of = {}  # type: dict[UUID, list[UUID]]
+    while stack:
+        obj_dict, cur_base_path, cur_parent = stack.pop()
+
+        # Names like "detector" or "bandpass" recur many times in the tree,
+        # so it is worth sharing one copy of each string. YAML parses names
+        # like `30` as numbers, but they are path components
+        name = sys.intern(str(obj_dict["name"]))
+        uuid = UUID(obj_dict["uuid"])
+        full_path = f"{cur_base_path}/{name}"
+
+        dictionary[uuid] = Entity(
+            uuid=uuid,
+            name=name,
+            full_path=full_path,
+            parent=cur_parent,
         )
-        dictionary[obj.uuid] = obj
+        path_to_entity[full_path] = uuid
+        if cur_parent is not None:
+            children_of.setdefault(cur_parent, []).append(uuid)
 
+        children = obj_dict.get("children")
         if children:
-            _walk_entity_tree_and_parse(
-                dictionary=dictionary,
-                objs=children,
-                base_path=f"{base_path}/{obj.name}",
-                parent=obj.uuid,
+            stack.extend(
+                (child_dict, full_path, uuid) for child_dict in reversed(children)
             )
 
+    for cur_uuid, cur_children in children_of.items():
+        dictionary[cur_uuid].children = frozenset(cur_children)
+
 
 def _parse_quantity(obj_dict: dict[str, Any]) -> Quantity:
     format_spec = None  # type: Union[UUID, None]
@@ -130,41 +183,32 @@ def _parse_quantity(obj_dict: dict[str, Any]) -> Quantity:
 
     return Quantity(
         uuid=UUID(obj_dict["uuid"]),
-        name=obj_dict.get("name", ""),
+        name=sys.intern(str(obj_dict.get("name", ""))),
         format_spec=format_spec,
         entity=UUID(obj_dict["entity"]),
     )
 
 
 def parse_data_file(storage_path: Path, obj_dict: dict[str, Any]) -> DataFile:
-    dependencies = set()  # type: set[UUID]
-    if "dependencies" in obj_dict:
-        dependencies = set([UUID(x) for x in obj_dict["dependencies"]])
-
+    # Paths are kept as strings: the `DataFile` class converts them
+    # into `pathlib.Path` objects only if they are actually used
     if "file_name" in obj_dict:
-        file_name = Path(obj_dict["file_name"])
-    else:
-        file_name = None
-
-    if "plot_file" in obj_dict:
-        plot_file_name = Path(obj_dict["plot_file"])
+        data_file_local_path = os.path.join(storage_path, obj_dict["file_name"])
     else:
-        plot_file_name = None
+        data_file_local_path = None
 
     return DataFile(
         uuid=UUID(obj_dict["uuid"]),
         name=obj_dict.get("name", ""),
-        upload_date=parser.isoparse(obj_dict["upload_date"]),
+        upload_date=parse_iso8601(obj_dict["upload_date"]),
         metadata=obj_dict.get("metadata", None),
-        data_file_local_path=storage_path / file_name
-        if file_name is not None
-        else None,
+        data_file_local_path=data_file_local_path,
         data_file_download_url=None,
         quantity=UUID(obj_dict["quantity"]),
-        spec_version=obj_dict.get("spec_version", ""),
-        dependencies=dependencies,
-        plot_file_local_path=plot_file_name,
-        plot_mime_type=obj_dict.get("plot_mime_type", ""),
+        spec_version=_intern(obj_dict.get("spec_version", "")),
+        dependencies=[UUID(x) for x in obj_dict.get("dependencies", ())],
+        plot_file_local_path=obj_dict.get("plot_file", None),
+        plot_mime_type=_intern(obj_dict.get("plot_mime_type", "")),
         comment=obj_dict.get("comment", ""),
         release_tags=None,  # We'll fill this later
     )
@@ -173,9 +217,9 @@ def parse_data_file(storage_path: Path, obj_dict: dict[str, Any]) -> DataFile:
 def _parse_release(obj_dict: dict[str, Any]) -> Release:
     return Release(
         tag=obj_dict["tag"],
-        rel_date=parser.isoparse(obj_dict["release_date"]),
+        rel_date=parse_iso8601(obj_dict["release_date"]),
         comment=obj_dict.get("comments", ""),
-        data_files=set([UUID(x) for x in obj_dict.get("data_files", [])]),
+        data_files=[UUID(x) for x in obj_dict.get("data_files", ())],
     )
 
 
@@ -193,15 +237,18 @@ def _parse_data_file_path(path: str) -> tuple[str, str, str]:
     3. The name of the quantity (``quantity``)
     """
 
-    parts = [x for x in path.split("/") if x != ""]
-    if len(parts) < 3:
-        raise ValueError(f'Malformed path to data file: "{path}"')
+    path = path.strip("/")
+    if "//" in path:
+        # Drop empty components, e.g., when the path was built by
+        # joining strings that already start with a slash
+        path = "/".join(x for x in path.split("/") if x)
 
-    relname = parts[0]
-    middle = parts[1:-1]
-    quantity = parts[-1]
+    rest, _, quantity = path.rpartition("/")
+    relname, _, entity_path = rest.partition("/")
+    if not (relname and entity_path and quantity):
+        raise ValueError(f'Malformed path to data file: "{path}"')
 
-    return relname, "/" + ("/".join(middle)), quantity
+    return relname, "/" + entity_path, quantity
 
 
 class InstrumentDbFormatError(Exception):
@@ -228,13 +275,28 @@ class LocalInsDb(InstrumentDatabase):
     to create a :class:`.LocalInsDb` instance: just the JSON file containing the
     schema is read on the spot. Of course, if you do not have anything else than
     the JSON schema, you cannot call methods like :meth:`.query_data_file`.
+
+    Parsing a large schema can take some time. If you pass a file name
+    to `cache_file`, the parsed schema is saved there and loaded back the
+    next time a :class:`.LocalInsDb` is created with the same `cache_file`,
+    as long as the schema file has not been modified in the meantime.
+    As the storage is read-only, you should pick a path outside
+    `storage_path`.
     """
 
-    def __init__(self, storage_path: Union[str, Path]):
+    def __init__(
+        self,
+        storage_path: Union[str, Path],
+        cache_file: Union[str, Path, None] = None,
+    ):
         super().__init__()
 
         self.storage_path = Path(storage_path)
+        self.cache_file = Path(cache_file) if cache_file is not None else None
         self.schema_file_name = ""  # It will be initialized by self.check_consistency()
+        self.schema_file_path = (
+            Path()
+        )  # It will be initialized by self.check_consistency()
         self.are_data_files_available = (
             False  # It will be initialized by self.read_schema()
         )
@@ -250,6 +312,8 @@ class LocalInsDb(InstrumentDatabase):
 
         self.path_to_entity = {}  # type: dict[str, UUID]
         self.path_to_quantity = {}  # type: dict[str, UUID]
+        # Map (release tag, quantity UUID) to the UUID of the data file
+        self.release_quantity_to_data_file = {}  # type: dict[tuple[str, UUID], UUID]
 
         self.check_consistency()
         self.read_schema()
@@ -264,22 +328,29 @@ class LocalInsDb(InstrumentDatabase):
         obvious errors.
         """
 
+        # Once the schema file has been found, we remember its path and its
+        # parser, so that `read_schema` does not need to look for it again
         found = False
         if self.storage_path.is_file():
             path = self.storage_path
-            self.schema_file_name = path.name
-            for cur_ext, _ in _DB_FLATFILE_SCHEMA_FILE_EXTENSIONS:
-                self.schema_file_name = self.schema_file_name.removesuffix(cur_ext)
+            for cur_ext, cur_parser in _DB_FLATFILE_SCHEMA_FILE_EXTENSIONS:
+                if path.name.endswith(cur_ext):
+                    found = True
+                    self.schema_file_name = path.name.removesuffix(cur_ext)
+                    self.schema_file_path = path
+                    self.file_parser = cur_parser
+                    break
             self.storage_path = path.parent
-            found = True
         else:
-            for cur_ext, _ in _DB_FLATFILE_SCHEMA_FILE_EXTENSIONS:
+            for cur_ext, cur_parser in _DB_FLATFILE_SCHEMA_FILE_EXTENSIONS:
                 schema_file_path = self.storage_path / (
                     _DB_FLATFILE_SCHEMA_FILE_NAME + cur_ext
                 )
                 if schema_file_path.exists():
                     found = True
                     self.schema_file_name = _DB_FLATFILE_SCHEMA_FILE_NAME
+                    self.schema_file_path = schema_file_path
+                    self.file_parser = cur_parser
                     break
 
         if not found:
@@ -297,13 +368,20 @@ class LocalInsDb(InstrumentDatabase):
         it on the fly before parsing its contents.
         """
 
+        data_files_path = self.storage_path / "data_files"
+        self.are_data_files_available = data_files_path.exists()
+
         schema = None
-        for cur_ext, cur_parser in _DB_FLATFILE_SCHEMA_FILE_EXTENSIONS:
-            schema_file_path = self.storage_path / (self.schema_file_name + cur_ext)
-            try:
-                schema = cur_parser(schema_file_path)
-            except FileNotFoundError:
-                continue
+        cache_key = None
+        try:
+            if self.cache_file is not None:
+                cache_key = _schema_cache_key(self.schema_file_path, self.storage_path)
+                if self._load_schema_cache(cache_key):
+                    return
+
+            schema = self.file_parser(self.schema_file_path)
+        except FileNotFoundError:
+            pass
 
         if not schema:
             raise InstrumentDbFormatError(
@@ -312,24 +390,84 @@ class LocalInsDb(InstrumentDatabase):
                 )
             )
 
-        data_files_path = self.storage_path / "data_files"
-        self.are_data_files_available = data_files_path.exists()
-
         self.parse_schema(schema)
 
+        if cache_key is not None:
+            self._save_schema_cache(cache_key)
+
+    def _load_schema_cache(self, cache_key: tuple[Any, ...]) -> bool:
+        """Load the parsed schema from `self.cache_file`
+
+        Return ``False`` if the cache is missing, stale, or unreadable.
+        """
+        assert self.cache_file is not None
+
+        try:
+            with self.cache_file.open("rb") as inpf:
+                # The key is saved first, so that we can detect a stale cache
+                # without unpickling all the objects
+                if pickle.load(inpf) != cache_key:
+                    return False
+
+                state = pickle.load(inpf)
+        except Exception:
+            # A corrupted or incompatible cache is simply rebuilt
+            return False
+
+        for attr in _PARSED_SCHEMA_ATTRIBUTES:
+            setattr(self, attr, state[attr])
+
+        return True
+
+    def _save_schema_cache(self, cache_key: tuple[Any, ...]) -> None:
+        """Save the parsed schema into `self.cache_file`
+
+        The file is written under a temporary name and then renamed, so
+        that concurrent processes never read a half-written cache. Errors
+        are ignored, as the cache is just an optimization.
+        """
+        assert self.cache_file is not None
+
+        try:
+            fd, tmp_file_name = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=self.cache_file.name
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as outf:
+                pickle.dump(cache_key, outf, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(
+                    {attr: getattr(self, attr) for attr in _PARSED_SCHEMA_ATTRIBUTES},
+                    outf,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_file_name, self.cache_file)
+        except OSError:
+            Path(tmp_file_name).unlink(missing_ok=True)
+
     def parse_schema(self, schema: dict[str, Any]) -> None:
-        self.format_specs = {}
-        for obj_dict in schema.get("format_specifications", []):
-            cur_fmt_spec = _parse_format_spec(obj_dict)
-            self.format_specs[cur_fmt_spec.uuid] = cur_fmt_spec
+        self.format_specs = {
+            x.uuid: x
+            for x in map(_parse_format_spec, schema.get("format_specifications", []))
+        }
 
         self.entities = {}
-        _walk_entity_tree_and_parse(self.entities, schema.get("entities", []))
+        self.path_to_entity = {}
+        _walk_entity_tree_and_parse(
+            self.entities, self.path_to_entity, schema.get("entities", [])
+        )
+
+        self.quantities = {
+            x.uuid: x for x in map(_parse_quantity, schema.get("quantities", []))
+        }
 
-        self.quantities = {}
-        for obj_dict in schema.get("quantities", []):
-            cur_quantity = _parse_quantity(obj_dict)
-            self.quantities[cur_quantity.uuid] = cur_quantity
+        # The sets of UUIDs/tags are frozen once they are complete, so we
+        # collect their elements while parsing the objects that they refer to
+        data_files_of = {}  # type: dict[UUID, list[UUID]]
+        release_tags_of = {}  # type: dict[UUID, list[str]]
+        quantities_of = {}  # type: dict[UUID, list[UUID]]
 
         self.data_files = {}
         for obj_dict in schema.get("data_files", []):
@@ -337,39 +475,46 @@ class LocalInsDb(InstrumentDatabase):
                 storage_path=self.storage_path, obj_dict=obj_dict
             )
             self.data_files[cur_data_file.uuid] = cur_data_file
+            data_files_of.setdefault(cur_data_file.quantity, []).append(
+                cur_data_file.uuid
+            )
 
         self.releases = {}
+        self.release_quantity_to_data_file = {}
         for obj_dict in schema.get("releases", []):
             cur_release = _parse_release(obj_dict)
             self.releases[cur_release.tag] = cur_release
+            self._fill_release_tags(cur_release, release_tags_of)
 
-        self.path_to_entity = {}
-        for uuid, entity in self.entities.items():
-            # For a local database, entity.full_path should *always* be set
-            assert entity.full_path is not None
-            self.path_to_entity[entity.full_path] = uuid
-
-        self.path_to_quantity = {
-            self.quantity_path(quantity.uuid): uuid
-            for uuid, quantity in self.quantities.items()
-        }
-
+        # Link each quantity to its entity and compute its path in the same
+        # pass: this is what `quantity_path` does, without looking up the
+        # entity twice
+        self.path_to_quantity = {}
         for cur_uuid, cur_quantity in self.quantities.items():
-            if cur_quantity.entity:
-                entity = self.entities[cur_quantity.entity]
-                entity.quantities.add(cur_uuid)
-
-        for cur_uuid, cur_data_file in self.data_files.items():
-            quantity = self.quantities[cur_data_file.quantity]
-            quantity.data_files.add(cur_uuid)
-
-        self._fill_release_tags()
-
-    def _fill_release_tags(self):
-        "Fix the value of `release_tags` for each data file"
-        for cur_release_tag, cur_release in self.releases.items():
-            for cur_uuid in cur_release.data_files:
-                self.data_files[cur_uuid].release_tags.add(cur_release_tag)
+            assert cur_quantity.entity
+            entity = self.entities[cur_quantity.entity]
+            quantities_of.setdefault(entity.uuid, []).append(cur_uuid)
+            self.path_to_quantity[f"{entity.full_path}/{cur_quantity.name}"] = cur_uuid
+
+        for cur_uuid, cur_data_files in data_files_of.items():
+            self.quantities[cur_uuid].data_files = frozenset(cur_data_files)
+
+        for cur_uuid, cur_release_tags in release_tags_of.items():
+            self.data_files[cur_uuid].release_tags = frozenset(cur_release_tags)
+
+        for cur_uuid, cur_quantities in quantities_of.items():
+            self.entities[cur_uuid].quantities = frozenset(cur_quantities)
+
+    def _fill_release_tags(
+        self, release: Release, release_tags_of: dict[UUID, list[str]]
+    ) -> None:
+        "Add the tag of `release` to the tags of its data files and index them"
+        for cur_uuid in release.data_files:
+            cur_data_file = self.data_files[cur_uuid]
+            release_tags_of.setdefault(cur_uuid, []).append(release.tag)
+            self.release_quantity_to_data_file[
+                (release.tag, cur_data_file.quantity)
+            ] = cur_uuid
 
     def quantity_path(self, uuid: UUID) -> str:
         quantity = self.quantities[uuid]
@@ -392,20 +537,15 @@ class LocalInsDb(InstrumentDatabase):
         if isinstance(identifier, UUID):
             return self.quantities[identifier]
         else:
-            path_components = identifier.split("/")
-            entity_path = "/".join(path_components[:-1])
-            quantity_name = path_components[-1]
-
-            entity_uuid = self.path_to_entity[entity_path]
-            entity = self.entities[entity_uuid]
-            for cur_quantity_uuid in entity.quantities:
-                cur_quantity = self.quantities[cur_quantity_uuid]
-                if cur_quantity.name == quantity_name:
-                    return cur_quantity
+            # `identifier` contains a path
+            try:
+                return self.quantities[self.path_to_quantity[identifier]]
+            except KeyError:
+                entity_path, _, quantity_name = identifier.rpartition("/")
 
-            raise KeyError(
-                f'quantity "{quantity_name}" not found for entity "{entity_path}"'
-            )
+                raise KeyError(
+                    f'quantity "{quantity_name}" not found for entity "{entity_path}"'
+                )
 
     def query_data_file(self, identifier: str | UUID, track: bool = True) -> DataFile:
         """Retrieve a data file
@@ -433,67 +573,64 @@ class LocalInsDb(InstrumentDatabase):
                 self.add_uuid_to_tracked_list(uuid=identifier)
 
             return self.data_files[identifier]
-        else:
-            try:
-                uuid = UUID(identifier)
-
-                if track:
-                    self.add_uuid_to_tracked_list(uuid=uuid)
+        elif looks_like_uuid(identifier):
+            uuid = UUID(identifier)
 
-                return self.data_files[uuid]
-            except ValueError:
-                # We're dealing with a path
-                stripped_identifier = identifier.removeprefix("/releases/")
+            if track:
+                self.add_uuid_to_tracked_list(uuid=uuid)
 
-                relname, entity_path, quantity_name = _parse_data_file_path(
-                    stripped_identifier
-                )
-                release_uuids = self.releases[relname].data_files
-                entity = self.entities[self.path_to_entity[entity_path]]
-
-                # Retrieve the quantity whose name matches the last
-                # part of the path
-                quantity = None
-                for cur_uuid in entity.quantities:
-                    cur_quantity = self.quantities[cur_uuid]
-                    if cur_quantity.name == quantity_name:
-                        quantity = self.quantities[cur_quantity.uuid]
-                        break
-
-                if not quantity:
-                    raise KeyError(
-                        (
-                            'wrong path: "{id}" points to entity '
-                            '"{path}", which does not have a quantity '
-                            'named "{quantity}"'
-                        ).format(
-                            id=identifier, path=entity.full_path, quantity=quantity_name
-                        )
-                    )
+            return self.data_files[uuid]
+        else:
+            # We're dealing with a path
+            stripped_identifier = identifier.removeprefix("/releases/")
 
-                # Now check which data file has a UUID that matches
-                # the one listed in the release
-                for cur_uuid in quantity.data_files:
-                    if cur_uuid in release_uuids:
-                        if track:
-                            self.add_uuid_to_tracked_list(uuid=cur_uuid)
+            relname, entity_path, quantity_name = _parse_data_file_path(
+                stripped_identifier
+            )
+            if relname not in self.releases:
+                raise KeyError(f'release "{relname}" not found')
 
-                        return self.data_files[cur_uuid]
+            entity = self.entities[self.path_to_entity[entity_path]]
 
+            # Retrieve the quantity whose name matches the last
+            # part of the path
+            quantity_uuid = self.path_to_quantity.get(f"{entity_path}/{quantity_name}")
+            if quantity_uuid is None:
                 raise KeyError(
                     (
-                        'wrong path: "{id}" points to quantity '
-                        '"{quantity}", which does not have data files '
-                        'belonging to release "{relname}" '
-                        "(data files are: {uuids})"
+                        'wrong path: "{id}" points to entity '
+                        '"{path}", which does not have a quantity '
+                        'named "{quantity}"'
                     ).format(
-                        id=identifier,
-                        quantity=quantity_name,
-                        relname=relname,
-                        uuids=", ".join([str(x)[0:6] for x in quantity.data_files]),
+                        id=identifier, path=entity.full_path, quantity=quantity_name
                     )
                 )
 
+            # Now check which data file of the quantity is listed in the release
+            data_file_uuid = self.release_quantity_to_data_file.get(
+                (relname, quantity_uuid)
+            )
+            if data_file_uuid is not None:
+                if track:
+                    self.add_uuid_to_tracked_list(uuid=data_file_uuid)
+
+                return self.data_files[data_file_uuid]
+
+            quantity = self.quantities[quantity_uuid]
+            raise KeyError(
+                (
+                    'wrong path: "{id}" points to quantity '
+                    '"{quantity}", which does not have data files '
+                    'belonging to release "{relname}" '
+                    "(data files are: {uuids})"
+                ).format(
+                    id=identifier,
+                    quantity=quantity_name,
+                    relname=relname,
+                    uuids=", ".join([str(x)[0:6] for x in quantity.data_files]),
+                )
+            )
+
     def query_release(self, tag: str) -> Release:
         return self.releases[tag]
 
@@ -523,10 +660,5 @@ class LocalInsDb(InstrumentDatabase):
     def merge(self, other: "LocalInsDb") -> None:
         """Merge another :class:`.LocalInsDb` object into this one"""
 
-        self.format_specs = {**self.format_specs, **other.format_specs}
-        self.entities = {**self.entities, **other.entities}
-        self.quantities = {**self.quantities, **other.quantities}
-        self.data_files = {**self.data_files, **other.data_files}
-        self.releases = {**self.releases, **other.releases}
-        self.path_to_entity = {**self.path_to_entity, **other.path_to_entity}
-        self.path_to_quantity = {**self.path_to_quantity, **other.path_to_quantity}
+        for attr in _PARSED_SCHEMA_ATTRIBUTES:
+            getattr(self, attr).update(getattr(other, attr))
@@ -5,9 +5,51 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, TypeVar
 from uuid import UUID
 
+_T = TypeVar("_T")
+
+# Most objects have no children/tags/etc., so they all share the same empty set
+_EMPTY_FROZENSET = frozenset()  # type: frozenset[Any]
+
+
+def _to_frozenset(items: Iterable[_T] | None) -> frozenset[_T]:
+    if not items:
+        return _EMPTY_FROZENSET
+
+    result = frozenset(items)
+    return result if result else _EMPTY_FROZENSET
+
+
+class _LazyPath:
+    """An attribute holding a ``pathlib.Path`` object or ``None``
+
+    The attribute can be set to a string, which is converted into a
+    ``pathlib.Path`` only when the attribute is read for the first time.
+    Most of the paths in a database are never used, and creating a
+    ``pathlib.Path`` is much slower than keeping a string.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr_name = "_" + name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        # Return the descriptor itself when accessed through the class,
+        # like properties do, so that introspection tools can find it
+        if obj is None:
+            return self
+
+        value = getattr(obj, self.attr_name)
+        if isinstance(value, str):
+            value = Path(value)
+            setattr(obj, self.attr_name, value)
+
+        return value
+
+    def __set__(self, obj: Any, value: Path | str | None) -> None:
+        setattr(obj, self.attr_name, value)
+
 
 class FormatSpecification:
     """A format specification for a quantity in the database.
@@ -45,12 +87,23 @@ class FormatSpecification:
 
     """
 
+    __slots__ = (
+        "uuid",
+        "document_ref",
+        "title",
+        "_local_doc_file_path",
+        "doc_mime_type",
+        "file_mime_type",
+    )
+
+    local_doc_file_path = _LazyPath()
+
     def __init__(
         self,
         uuid: UUID,
         document_ref: str,
         title: str,
-        local_doc_file_path: Path | None,
+        local_doc_file_path: Path | str | None,
         doc_mime_type: str,
         file_mime_type: str,
     ):
@@ -87,29 +140,32 @@ class Entity:
     - ``parent``: the UUID of the parent entity, or `None` if this is
       a root entity.
 
-    - ``quantities``: a ``set`` object containing the UUID of each
+    - ``quantities``: a ``frozenset`` object containing the UUID of each
       quantity belonging to this entity (see the :class:`.Quantity`
       class).
 
+    - ``children``: a ``frozenset`` object containing the UUID of each
+      entity whose parent is this entity.
+
     """
 
+    __slots__ = ("uuid", "name", "full_path", "parent", "quantities", "children")
+
     def __init__(
         self,
         uuid: UUID,
         name: str,
         full_path: str | None = None,
         parent: UUID | None = None,
-        quantities: set[UUID] | None = None,
+        quantities: Iterable[UUID] | None = None,
+        children: Iterable[UUID] | None = None,
     ):
         self.uuid = uuid
         self.name = name
         self.full_path = full_path
         self.parent = parent
-
-        if quantities is not None:
-            self.quantities = quantities
-        else:
-            self.quantities = set()
+        self.quantities = _to_frozenset(quantities)
+        self.children = _to_frozenset(children)
 
 
 class Quantity:
@@ -137,28 +193,26 @@ class Quantity:
 
     - ``entity``: the UUID of a :class:`.Entity` object.
 
-    - ``data_files``: a `set` containing the UUIDs of the data files
+    - ``data_files``: a `frozenset` containing the UUIDs of the data files
       belonging to this quantity.
 
     """
 
+    __slots__ = ("uuid", "name", "format_spec", "entity", "data_files")
+
     def __init__(
         self,
         uuid: UUID,
         name: str,
         format_spec: UUID | None,
         entity: UUID,
-        data_files: set[UUID] | None = None,
+        data_files: Iterable[UUID] | None = None,
     ):
         self.uuid = uuid
         self.name = name
         self.format_spec = format_spec
         self.entity = entity
-
-        if data_files is not None:
-            self.data_files = data_files
-        else:
-            self.data_files = set()
+        self.data_files = _to_frozenset(data_files)
 
 
 class DataFile:
@@ -198,8 +252,8 @@ class DataFile:
       :class:`.FormatSpecification` object. There are no constraints
       on the way this string is formatted.
 
-    - ``dependencies``: a ``set`` object containing the UUIDs of other
-      data files that have been used to create this very file.
+    - ``dependencies``: a ``frozenset`` object containing the UUIDs of
+      other data files that have been used to create this very file.
 
     - ``plot_file_local_path``: either a `pathlib.Path` object pointing to
       an image file that contains a plot of the quantities in the data
@@ -211,23 +265,45 @@ class DataFile:
     - ``comment``: a string containing free-form comments related to
       this data file.
 
+    - ``release_tags``: a ``frozenset`` object containing the tags of
+      the releases that include this data file.
+
     """
 
+    __slots__ = (
+        "uuid",
+        "name",
+        "upload_date",
+        "metadata",
+        "_data_file_local_path",
+        "data_file_download_url",
+        "quantity",
+        "spec_version",
+        "dependencies",
+        "_plot_file_local_path",
+        "plot_mime_type",
+        "comment",
+        "release_tags",
+    )
+
+    data_file_local_path = _LazyPath()
+    plot_file_local_path = _LazyPath()
+
     def __init__(
         self,
         uuid: UUID,
         name: str,
         upload_date: datetime,
-        metadata: dict[str, Any],
-        data_file_local_path: Path | None,
+        metadata: dict[str, Any] | None,
+        data_file_local_path: Path | str | None,
         data_file_download_url: Path | None,
         quantity: UUID,
         spec_version: str,
-        dependencies: set[UUID],
-        plot_file_local_path: Path | None,
+        dependencies: Iterable[UUID] | None,
+        plot_file_local_path: Path | str | None,
         plot_mime_type: str,
         comment: str,
-        release_tags: set[str] | None = None,
+        release_tags: Iterable[str] | None = None,
     ):
         assert not (
             (data_file_local_path is not None) and (data_file_download_url is not None)
@@ -240,15 +316,11 @@ class DataFile:
         self.data_file_download_url = data_file_download_url
         self.quantity = quantity
         self.spec_version = spec_version
-        self.dependencies = dependencies
+        self.dependencies = _to_frozenset(dependencies)
         self.plot_file_local_path = plot_file_local_path
         self.plot_mime_type = plot_mime_type
         self.comment = comment
-
-        if release_tags is not None:
-            self.release_tags = release_tags
-        else:
-            self.release_tags = set()
+        self.release_tags = _to_frozenset(release_tags)
 
     def open_data_file(self, database: Any):
         return database.open_data_file(self)
@@ -269,15 +341,35 @@ class Release:
 
     - ``comments``: a free-form string.
 
-    - ``data_files``: a ``set`` object containing the UUIDs of the
+    - ``data_files``: a ``frozenset`` object containing the UUIDs of the
       :class:`DataFile` objects that make this release.
 
     """
 
+    __slots__ = ("tag", "rel_date", "comment", "data_files")
+
     def __init__(
-        self, tag: str, rel_date: datetime, comment: str, data_files: set[UUID]
+        self,
+        tag: str,
+        rel_date: datetime,
+        comment: str,
+        data_files: Iterable[UUID] | None = None,
     ):
         self.tag = tag
         self.rel_date = rel_date
         self.comment = comment
-        self.data_files = data_files
+        self.data_files = _to_frozenset(data_files)
+
+    def fetch_data_files(
+        self, database: Any, track: bool = True
+    ) -> dict[UUID, DataFile]:
+        """Retrieve all the data files in this release from `database`
+
+        Return a dictionary associating the UUID of each data file with
+        the :class:`DataFile` object. The data files are retrieved through
+        ``database.query_data_files``, so that a :class:`.RemoteInsDb`
+        sends the requests to the server in parallel.
+        """
+        uuids = list(self.data_files)
+        data_files = database.query_data_files(uuids, track=track)
+        return dict(zip(uuids, data_files))
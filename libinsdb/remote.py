@@ -2,19 +2,42 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BufferedReader
 from pathlib import Path
 from tempfile import TemporaryFile
-from typing import Any, Union, IO
-from urllib.parse import urljoin
+from typing import Any, Callable, Iterable, TypeVar, Union, IO
+from urllib.parse import urljoin, urlsplit
 from uuid import UUID
 
-from dateutil import parser
-
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
 
 from .objects import FormatSpecification, Entity, Quantity, DataFile, Release
-from .instrumentdb import InstrumentDatabase
+from .instrumentdb import InstrumentDatabase, looks_like_uuid, parse_iso8601
+
+# Maximum number of requests that :meth:`.RemoteInsDb.query_data_files`
+# sends to the server at the same time
+_MAX_PARALLEL_REQUESTS = 8
+
+# Idempotent requests that fail because of a temporary problem of the
+# server (e.g., a restart behind a reverse proxy) are sent again this
+# number of times
+_MAX_RETRIES = 3
+
+# Size of the chunks used to download data files
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of responses whose ETag and body are kept in memory
+# to send conditional requests; the least recently used are dropped
+_MAX_ETAG_CACHE_SIZE = 1024
+
+_T = TypeVar("_T")
 
 
 class InstrumentDbConnectionError(Exception):
@@ -43,20 +66,35 @@ class InstrumentDbConnectionError(Exception):
 
 
 def extract_last_part_from_url(url: str) -> str:
-    parts = [x for x in url.split("/") if x != ""]
-    return parts[-1]
+    return url.rstrip("/").rpartition("/")[2]
 
 
+@lru_cache(maxsize=65536)
 def uuid_from_url(url: str) -> UUID:
     """Given an URL, return the UUID
 
     The function assumes that the UUID is always the last component of the URL.
     This is always the case for the InstrumentDB API.
+
+    The same URLs appear over and over in the responses of the server (e.g.,
+    the format specification of a quantity), so results are cached and equal
+    URLs share the same ``UUID`` object.
     """
 
     return UUID(extract_last_part_from_url(url))
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """Decode the JSON body of a response
+
+    Every JSON document returned by the server is decoded through this
+    function. The body is decoded directly from its bytes, which skips the
+    text decoding performed by ``requests.Response.json``.
+    """
+
+    return json.loads(response.content)
+
+
 def _validate_response_and_return_json(response: requests.Response) -> dict[str, Any]:
     """Check that the response is ok; otherwise, raise an InstrumentDBError"""
 
@@ -70,24 +108,55 @@ def _validate_response_and_return_json(response: requests.Response) -> dict[str,
         return {}
 
     try:
-        return response.json()
-    except requests.exceptions.JSONDecodeError as err:
+        return _decode_json(response)
+    except json.JSONDecodeError as err:
         raise InstrumentDbConnectionError(
             message=f"{response=} returned {err=} with {response.reason=}",
             response=response,
         )
 
 
-def _normalize_relative_path(parent_path: str) -> str:
-    "Remove leading and trailing backslashes from a relative URL path"
+# Ports that can be omitted from a URL
+_DEFAULT_PORTS = {"http": 80, "https": 443}
 
-    if parent_path.startswith("/"):
-        parent_path.removeprefix("/")
 
-    if parent_path.endswith("/"):
-        parent_path.removesuffix("/")
+def _host_and_port(url: str) -> tuple[str | None, int | None]:
+    """Return the lowercase host name and the port of `url`
 
-    return parent_path
+    The port is ``None`` if it is the default one for the scheme, so
+    that ``http://`` and ``https://`` URLs pointing to the same host
+    match (e.g., download links produced behind a TLS-terminating proxy).
+    """
+    parts = urlsplit(url)
+    port = parts.port
+    if port == _DEFAULT_PORTS.get(parts.scheme.lower()):
+        port = None
+
+    return parts.hostname, port
+
+
+class _TokenAuth(AuthBase):
+    """Attach the authentication token to the requests sent to the server
+
+    The token is not sent to any other host the session talks to (e.g.,
+    when the session was provided by the user).
+    """
+
+    def __init__(self, token: str, server_root: str):
+        self.header = "Token " + token
+        self.server = _host_and_port(server_root)
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        if _host_and_port(request.url or "") == self.server:
+            request.headers["Authorization"] = self.header
+
+        return request
+
+
+def _normalize_relative_path(parent_path: str) -> str:
+    "Remove leading and trailing slashes from a relative URL path"
+
+    return parent_path.strip("/")
 
 
 class RemoteInsDb(InstrumentDatabase):
@@ -101,18 +170,130 @@ class RemoteInsDb(InstrumentDatabase):
     modify the content of the database, either by patching what is
     already saved in the database, by adding new objects, or by
     deleting existing ones.
+
+    All the requests are sent through the same ``requests.Session``
+    object, which is saved in the field ``session``: in this way, the
+    TCP/TLS connection to the server is kept alive and reused across
+    queries. Call :meth:`.close` once you are done with the database
+    to release the connection, or use the object as a context manager::
+
+        with RemoteInsDb(server_address, username, password) as insdb:
+            entity = insdb.query_entity("/LFI/frequency_030_ghz/27M")
+
+    You can pass your own session through the parameter `session`. This
+    is useful to keep a persistent cache of the responses across
+    different processes, e.g., using the
+    `requests-cache <https://requests-cache.readthedocs.io/>`_ package::
+
+        import requests_cache
+
+        insdb = RemoteInsDb(
+            server_address="https://insdbdemo.fisica.unimi.it",
+            username="demo",
+            password="planckdbdemo",
+            session=requests_cache.CachedSession("insdb_cache"),
+        )
+
+    The session is not modified: the authentication token is attached only
+    to the requests sent to the InstrumentDB server. Moreover, :meth:`.close`
+    does not close a session that was passed by the user.
+
+    Requests for objects that were already retrieved from the server
+    (e.g., after a call to :meth:`.clear_cache`) carry the ``ETag``
+    returned by the server, so that unchanged objects are not
+    transferred again.
+
+    Entities, quantities, format specifications, data files, and releases
+    are cached in memory once they have been retrieved from the server, so that
+    querying the same object twice does not require another round
+    trip. The caches are emptied whenever the database is modified
+    through :meth:`.post`, :meth:`.patch`, or :meth:`.delete`; call
+    :meth:`.clear_cache` if the database might have been modified
+    by somebody else.
     """
 
-    def __init__(self, server_address: str, username: str, password: str):
+    def __init__(
+        self,
+        server_address: str,
+        username: str,
+        password: str,
+        session: requests.Session | None = None,
+    ):
         super().__init__()
 
         self.server_address = server_address
-        response = requests.post(
-            urljoin(self.server_address, "/api/login"),
+        # The queries use absolute paths on the server, so that they
+        # ignore any path in `server_address`, like `urljoin` does. We
+        # compute the root once instead of calling `urljoin` every time
+        self._server_root = urljoin(server_address, "/").rstrip("/")
+        self._entity_cache = {}  # type: dict[UUID, Entity]
+        self._quantity_cache = {}  # type: dict[UUID, Quantity]
+        self._format_spec_cache = {}  # type: dict[UUID, FormatSpecification]
+        self._release_cache = {}  # type: dict[str, Release]
+        self._data_file_cache = {}  # type: dict[UUID, DataFile]
+        # Map URLs to the ETag and the decoded body of the last response,
+        # from the least to the most recently used. The lock is needed
+        # because `query_data_files` sends requests from several threads
+        self._etag_cache = OrderedDict()  # type: OrderedDict[str, tuple[str, Any]]
+        self._etag_lock = threading.Lock()
+
+        # Sessions provided by the user are neither modified nor closed
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            # Keep enough connections alive to serve the parallel requests
+            # issued by `query_data_files`. The last response is returned
+            # even if all the retries fail, so that the error is reported
+            # through InstrumentDbConnectionError
+            adapter = HTTPAdapter(
+                pool_maxsize=_MAX_PARALLEL_REQUESTS,
+                max_retries=Retry(
+                    total=_MAX_RETRIES,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+        response = self.session.post(
+            f"{self._server_root}/api/login",
             data={"username": username, "password": password},
         )
         self._validate_response(response)
-        self.auth_header = {"Authorization": "Token " + response.json()["token"]}
+        token = _decode_json(response)["token"]
+        self.auth_header = {"Authorization": "Token " + token}
+        self._auth = _TokenAuth(token, self._server_root)
+
+    def close(self) -> None:
+        """Close the connection with the server
+
+        If the session was passed to the constructor, it is left open.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> RemoteInsDb:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Forget all the objects that have been retrieved from the server
+
+        The ``ETag`` headers returned by the server are kept, so that the
+        next queries ask the server whether the objects have changed
+        instead of downloading them again.
+        """
+        self._entity_cache.clear()
+        self._quantity_cache.clear()
+        self._format_spec_cache.clear()
+        self._release_cache.clear()
+        self._data_file_cache.clear()
 
     def _validate_response(
         self, response: requests.Response, expected_http_code: int = 200
@@ -120,46 +301,86 @@ class RemoteInsDb(InstrumentDatabase):
         if response.status_code != expected_http_code:
             raise InstrumentDbConnectionError(response, message="Unable to log in")
 
-    def query_entity(self, identifier: UUID | str) -> Entity:
-        try:
-            if isinstance(identifier, str):
-                uuid = UUID(identifier)
-            else:
-                uuid = identifier
+    def _get_json(self, url: str) -> Any:
+        """Send a GET request to the server and return the decoded JSON body
 
-            response = requests.get(
-                urljoin(self.server_address, f"/api/entities/{uuid}/"),
-                headers=self.auth_header,
-            )
-            self._validate_response(response)
-            entity_info = response.json()
-
-            return Entity(
-                uuid=uuid,
-                name=entity_info["name"],
-                full_path=None,
-                parent=uuid_from_url(entity_info["parent"]),
-                quantities=set([uuid_from_url(x) for x in entity_info["quantities"]]),
-            )
-        except ValueError:
-            # `identifier` is not a UUID, so it's probably a path
-            identifier = str(identifier).removeprefix("/").removesuffix("/")
-            response = requests.get(
-                urljoin(self.server_address, f"/tree/{identifier}"),
-                headers=self.auth_header,
-            )
-            self._validate_response(response)
-            return self.query_entity(UUID(response.json()["uuid"]))
+        If the server returned an ``ETag`` header the last time `url` was
+        requested, the request is made conditional: if the server replies
+        with ``304 Not Modified``, the body received the last time is
+        returned without being transferred and decoded again. Only the
+        last :data:`_MAX_ETAG_CACHE_SIZE` bodies are kept.
+        """
+
+        with self._etag_lock:
+            cached = self._etag_cache.get(url)
+            if cached is not None:
+                self._etag_cache.move_to_end(url)
+
+        response = self.session.get(
+            url,
+            headers={"If-None-Match": cached[0]} if cached is not None else None,
+            auth=self._auth,
+        )
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+
+        result = _validate_response_and_return_json(response)
+
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            with self._etag_lock:
+                self._etag_cache[url] = (etag, result)
+                self._etag_cache.move_to_end(url)
+                if len(self._etag_cache) > _MAX_ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+
+        return result
+
+    def query_entity(self, identifier: UUID | str) -> Entity:
+        if isinstance(identifier, UUID):
+            uuid = identifier
+        elif looks_like_uuid(identifier):
+            uuid = UUID(identifier)
+        else:
+            # `identifier` is a path
+            identifier = identifier.strip("/")
+            tree_info = self._get_json(f"{self._server_root}/tree/{identifier}")
+            uuid = UUID(tree_info["uuid"])
+
+            # The server usually returns the whole entity, so that there
+            # is no need for a second request
+            if uuid not in self._entity_cache and "quantities" in tree_info:
+                return self._create_entity_from_json(uuid, tree_info)
+
+        if uuid in self._entity_cache:
+            return self._entity_cache[uuid]
+
+        entity_info = self._get_json(f"{self._server_root}/api/entities/{uuid}/")
+        return self._create_entity_from_json(uuid, entity_info)
+
+    def _create_entity_from_json(
+        self, uuid: UUID, entity_info: dict[str, Any]
+    ) -> Entity:
+        entity = Entity(
+            uuid=uuid,
+            name=entity_info["name"],
+            full_path=None,
+            parent=uuid_from_url(entity_info["parent"]),
+            quantities={uuid_from_url(x) for x in entity_info["quantities"]},
+            children={uuid_from_url(x) for x in entity_info["children"]},
+        )
+        self._entity_cache[uuid] = entity
+        return entity
 
     def query_format_spec(self, identifier: UUID) -> FormatSpecification:
-        response = requests.get(
-            urljoin(self.server_address, f"/api/format_specs/{identifier}/"),
-            headers=self.auth_header,
+        if identifier in self._format_spec_cache:
+            return self._format_spec_cache[identifier]
+
+        format_spec_info = self._get_json(
+            f"{self._server_root}/api/format_specs/{identifier}/"
         )
-        self._validate_response(response)
-        format_spec_info = response.json()
 
-        return FormatSpecification(
+        format_spec = FormatSpecification(
             uuid=identifier,
             document_ref=format_spec_info["document_ref"],
             title=format_spec_info["title"],
@@ -167,74 +388,80 @@ class RemoteInsDb(InstrumentDatabase):
             doc_mime_type=format_spec_info["doc_mime_type"],
             file_mime_type=format_spec_info["file_mime_type"],
         )
+        self._format_spec_cache[identifier] = format_spec
+        return format_spec
 
     def query_quantity(self, identifier: UUID | str) -> Quantity:
-        try:
-            if isinstance(identifier, str):
-                uuid = UUID(identifier)
-            else:
-                uuid = identifier
-
-            response = requests.get(
-                urljoin(self.server_address, f"/api/quantities/{uuid}/"),
-                headers=self.auth_header,
-            )
-            self._validate_response(response)
-            quantity_info = response.json()
-
-            return Quantity(
-                uuid=uuid,
-                name=quantity_info["name"],
-                format_spec=uuid_from_url(quantity_info["format_spec"]),
-                entity=uuid_from_url(quantity_info["parent_entity"]),
-                data_files=set([uuid_from_url(x) for x in quantity_info["data_files"]]),
-            )
-        except ValueError:
-            # `identifier` is not a UUID, so it's probably a path
-            identifier = str(identifier).removeprefix("/").removesuffix("/")
-            response = requests.get(
-                urljoin(self.server_address, f"/tree/{identifier}"),
-                headers=self.auth_header,
-            )
-            self._validate_response(response)
-            return self.query_quantity(UUID(response.json()["uuid"]))
-
-    def _create_data_file_from_response(self, response: requests.Response) -> DataFile:
-        data_file_info = response.json()
+        if isinstance(identifier, UUID):
+            uuid = identifier
+        elif looks_like_uuid(identifier):
+            uuid = UUID(identifier)
+        else:
+            # `identifier` is a path
+            identifier = identifier.strip("/")
+            tree_info = self._get_json(f"{self._server_root}/tree/{identifier}")
+            uuid = UUID(tree_info["uuid"])
+
+            # The server usually returns the whole quantity, so that there
+            # is no need for a second request
+            if uuid not in self._quantity_cache and "data_files" in tree_info:
+                return self._create_quantity_from_json(uuid, tree_info)
+
+        if uuid in self._quantity_cache:
+            return self._quantity_cache[uuid]
+
+        quantity_info = self._get_json(f"{self._server_root}/api/quantities/{uuid}/")
+        return self._create_quantity_from_json(uuid, quantity_info)
+
+    def _create_quantity_from_json(
+        self, uuid: UUID, quantity_info: dict[str, Any]
+    ) -> Quantity:
+        quantity = Quantity(
+            uuid=uuid,
+            name=quantity_info["name"],
+            format_spec=uuid_from_url(quantity_info["format_spec"]),
+            entity=uuid_from_url(quantity_info["parent_entity"]),
+            data_files={uuid_from_url(x) for x in quantity_info["data_files"]},
+        )
+        self._quantity_cache[uuid] = quantity
+        return quantity
 
+    def _create_data_file_from_json(self, data_file_info: dict[str, Any]) -> DataFile:
         parsed_metadata = data_file_info.get("metadata", None)
 
-        return DataFile(
+        data_file = DataFile(
             uuid=uuid_from_url(data_file_info["uuid"]),
             name=data_file_info["name"],
-            upload_date=data_file_info["upload_date"],
+            upload_date=parse_iso8601(data_file_info["upload_date"]),
             metadata=parsed_metadata,
             data_file_local_path=None,
             data_file_download_url=data_file_info.get("download_link", None),
             quantity=uuid_from_url(data_file_info["quantity"]),
             spec_version=data_file_info["spec_version"],
-            dependencies=set(
-                [uuid_from_url(x) for x in data_file_info["dependencies"]]
-            ),
+            dependencies={uuid_from_url(x) for x in data_file_info["dependencies"]},
             plot_file_local_path=None,
             plot_mime_type=data_file_info["plot_mime_type"],
             comment=data_file_info["comment"],
-            release_tags=set(
-                [extract_last_part_from_url(x) for x in data_file_info["release_tags"]]
-            ),
+            release_tags={
+                extract_last_part_from_url(x) for x in data_file_info["release_tags"]
+            },
         )
+        self._data_file_cache[data_file.uuid] = data_file
+        return data_file
 
     def _query_data_file_from_uuid(self, uuid: UUID, track: bool) -> DataFile:
-        response = requests.get(
-            urljoin(self.server_address, f"/api/data_files/{uuid}/"),
-            headers=self.auth_header,
-        )
-        self._validate_response(response)
+        data_file = self._data_file_cache.get(uuid)
+        if data_file is None:
+            data_file_info = self._get_json(
+                f"{self._server_root}/api/data_files/{uuid}/"
+            )
+            data_file = self._create_data_file_from_json(data_file_info)
 
+        # Data files must be tracked even if they were already in the cache
         if track:
             self.add_uuid_to_tracked_list(uuid)
 
-        return self._create_data_file_from_response(response)
+        return data_file
 
     def query_data_file(
         self, identifier: Union[str, UUID], track: bool = True
@@ -242,53 +469,94 @@ class RemoteInsDb(InstrumentDatabase):
         if isinstance(identifier, UUID):
             return self._query_data_file_from_uuid(uuid=identifier, track=track)
 
-        try:
-            uuid = UUID(identifier)
-            return self._query_data_file_from_uuid(uuid, track=track)
-        except ValueError:
-            full_identifier = identifier
-            if not full_identifier.startswith("/releases/"):
-                full_identifier = f"/releases/{identifier}"
-
-            # `identifier` is a path into the tree
-            response = requests.get(
-                urljoin(self.server_address, full_identifier),
-                headers=self.auth_header,
-            )
-            self._validate_response(response)
-            result = self._create_data_file_from_response(response)
+        if looks_like_uuid(identifier):
+            return self._query_data_file_from_uuid(UUID(identifier), track=track)
 
-            if track:
-                self.add_uuid_to_tracked_list(result.uuid)
+        full_identifier = identifier
+        if not full_identifier.startswith("/releases/"):
+            full_identifier = f"/releases/{identifier}"
 
-            return result
+        # `identifier` is a path into the tree
+        data_file_info = self._get_json(self._server_root + full_identifier)
+        result = self._create_data_file_from_json(data_file_info)
 
-    def query_release(self, tag: str) -> Release:
-        response = requests.get(
-            urljoin(self.server_address, f"/api/releases/{tag}/"),
-            headers=self.auth_header,
+        if track:
+            self.add_uuid_to_tracked_list(result.uuid)
+
+        return result
+
+    def query_data_files(
+        self, identifiers: Iterable[Union[str, UUID]], track: bool = True
+    ) -> list[DataFile]:
+        """Retrieve several data files at once
+
+        The requests are sent to the server in parallel, so that the
+        network latency of each request overlaps with the others. See
+        :meth:`.InstrumentDatabase.query_data_files`.
+        """
+        return self._map_in_parallel(
+            lambda x: self.query_data_file(x, track=track), identifiers
         )
-        self._validate_response(response)
-        release_info = response.json()
 
-        return Release(
+    def query_many(
+        self,
+        identifiers: Iterable[Union[str, UUID]],
+        track: bool = True,
+    ) -> list[Union[DataFile, Quantity, Entity, FormatSpecification]]:
+        """Query several objects from the database
+
+        The requests are sent to the server in parallel, so that the
+        network latency of each request overlaps with the others. See
+        :meth:`.InstrumentDatabase.query_many`.
+        """
+        return self._map_in_parallel(lambda x: self.query(x, track=track), identifiers)
+
+    def _map_in_parallel(
+        self, function: Callable[[Any], _T], items: Iterable[Any]
+    ) -> list[_T]:
+        """Call `function` on each element of `items` using several threads
+
+        The results are returned in the same order as `items`.
+        """
+        items = list(items)
+        if len(items) < 2:
+            return [function(x) for x in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(items), _MAX_PARALLEL_REQUESTS)
+        ) as executor:
+            return list(executor.map(function, items))
+
+    def query_release(self, tag: str) -> Release:
+        if tag in self._release_cache:
+            return self._release_cache[tag]
+
+        release_info = self._get_json(f"{self._server_root}/api/releases/{tag}/")
+
+        release = Release(
             tag=release_info["tag"],
-            rel_date=parser.isoparse(release_info["rel_date"]),
+            rel_date=parse_iso8601(release_info["rel_date"]),
             comment=release_info["comment"],
-            data_files=set([uuid_from_url(x) for x in release_info["data_files"]]),
+            data_files={uuid_from_url(x) for x in release_info["data_files"]},
         )
+        self._release_cache[tag] = release
+        return release
 
     def open_data_file(self, data_file: DataFile) -> IO:
         """This is meant to be used as a context-manager"""
         assert data_file.data_file_download_url is not None
 
         f = TemporaryFile("w+b")
-        response = requests.get(
+        # Copy the file in chunks, so that large files are never kept
+        # in memory as a whole
+        with self.session.get(
             str(data_file.data_file_download_url),
             allow_redirects=True,
-            headers=self.auth_header,
-        )
-        f.write(response.content)
+            stream=True,
+            auth=self._auth,
+        ) as response:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
         f.seek(0)
 
         return f
@@ -308,11 +576,12 @@ class RemoteInsDb(InstrumentDatabase):
         will be raised.
         """
 
-        response = requests.post(
+        self.clear_cache()
+        response = self.session.post(
             url=url,
             data=data,
             files={} if files is None else files,
-            headers=self.auth_header,
+            auth=self._auth,
         )
         return _validate_response_and_return_json(response)
 
@@ -332,10 +601,10 @@ class RemoteInsDb(InstrumentDatabase):
         if url != "" and url[-1] != "/":
             url = url + "/"
 
-        response = requests.get(
+        response = self.session.get(
             url=url,
-            headers=self.auth_header,
             params=params if params is not None else {},
+            auth=self._auth,
         )
         return _validate_response_and_return_json(response)
 
@@ -353,11 +622,12 @@ class RemoteInsDb(InstrumentDatabase):
         will be raised.
         """
 
-        response = requests.patch(
+        self.clear_cache()
+        response = self.session.patch(
             url=url,
             data=data,
             files={} if files is None else files,
-            headers=self.auth_header,
+            auth=self._auth,
         )
         return _validate_response_and_return_json(response)
 
@@ -371,9 +641,10 @@ class RemoteInsDb(InstrumentDatabase):
         will be raised.
         """
 
-        response = requests.delete(
+        self.clear_cache()
+        response = self.session.delete(
             url=url,
-            headers=self.auth_header,
+            auth=self._auth,
         )
         return _validate_response_and_return_json(response)
 
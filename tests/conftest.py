@@ -0,0 +1,35 @@
+# -*- encoding: utf-8 -*-
+
+import copy
+
+import pytest  # type: ignore
+
+from libinsdb import LocalInsDb
+
+from .utils import MOCK_DB_PATH
+
+
+@pytest.fixture(scope="session")
+def mock_db() -> LocalInsDb:
+    """A local database loaded from ``mock_db_json``
+
+    The database is parsed only once and shared among all the tests,
+    so tests must not modify it. Querying data files adds them to the
+    list of queried files, so use ``fresh_mock_db`` for tests that query
+    data files, and ``new_mock_db`` if you need to modify the database.
+    """
+    return LocalInsDb(storage_path=MOCK_DB_PATH)
+
+
+@pytest.fixture
+def fresh_mock_db(mock_db) -> LocalInsDb:
+    """Same as ``mock_db``, but with an empty list of queried data files"""
+    db = copy.copy(mock_db)
+    db._tracked_data_files = set()
+    return db
+
+
+@pytest.fixture
+def new_mock_db() -> LocalInsDb:
+    """A local database loaded from ``mock_db_json`` that tests can modify"""
+    return LocalInsDb(storage_path=MOCK_DB_PATH)
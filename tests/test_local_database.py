@@ -7,14 +7,11 @@ import pytest  # type: ignore
 
 from libinsdb import LocalInsDb, Entity, Quantity, DataFile
 
+from .utils import TEST_DIR, MOCK_DB_PATH
 
-def load_mock_database():
-    curpath = Path(__file__).parent
-    return LocalInsDb(storage_path=curpath / "mock_db_json")
 
-
-def test_key_errors():
-    imo = load_mock_database()
+def test_key_errors(fresh_mock_db):
+    imo = fresh_mock_db
 
     with pytest.raises(KeyError):
         imo.query("/format_specs/aaaaaaaa-bbbb-cccc-dddd-eeeeeeffffff")
@@ -42,9 +39,23 @@ def test_key_errors():
         # data files in release 1.0
         imo.query("/1.0/instrument/beams/horn01/horn01_synth")
 
+    with pytest.raises(KeyError):
+        imo.query_quantity("/LFI/frequency_030_ghz/27M/UNKNOWN_QUANTITY")
+
+    with pytest.raises(KeyError):
+        imo.query_quantity("/LFI/WRONG/PATH/bandpass")
+
+    with pytest.raises(KeyError):
+        imo.query_data_file("/releases/UNKNOWN_TAG/LFI/frequency_044_ghz/24M/bandpass")
+
+    with pytest.raises(KeyError):
+        imo.query_data_file(
+            "/releases/planck2018/LFI/frequency_044_ghz/24M/UNKNOWN_QUANTITY"
+        )
+
 
-def test_query_uuid():
-    db = load_mock_database()
+def test_query_uuid(fresh_mock_db):
+    db = fresh_mock_db
 
     uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
     entity = db.query(f"/entities/{uuid}")
@@ -66,8 +77,8 @@ def test_query_uuid():
     assert data_file.uuid == uuid
 
 
-def test_get_queried_objects():
-    db = load_mock_database()
+def test_get_queried_objects(fresh_mock_db):
+    db = fresh_mock_db
 
     entity_uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
     _ = db.query(f"/entities/{entity_uuid}")
@@ -92,16 +103,38 @@ def test_get_queried_objects():
     assert release_data_file_uuid in queried_files
 
 
-def test_query_release():
-    db = load_mock_database()
+def test_untracked_queries(fresh_mock_db):
+    db = fresh_mock_db
+
+    # Neither UUIDs nor paths must be tracked if `track` is False
+    _ = db.query(UUID("25109593-c5e2-4b60-b06e-ac5e6c3b7b83"), track=False)
+    _ = db.query("/releases/planck2018/LFI/frequency_044_ghz/24M/bandpass", track=False)
+    assert not db.get_queried_data_files()
+
+
+def test_query_release(fresh_mock_db):
+    db = fresh_mock_db
 
     uuid = UUID("3ffd0d49-f06b-4c6a-9885-fb5b4f6db3ac")
     data_file = db.query("/releases/planck2018/LFI/frequency_044_ghz/24M/bandpass")
     assert data_file.uuid == uuid
 
+    # Paths built from `Entity.full_path` contain a double slash
+    entity = db.query_entity("/LFI/frequency_044_ghz/24M")
+    assert db.query_data_file(f"planck2018/{entity.full_path}/bandpass") is data_file
+    assert (
+        db.query_data_file(f"/releases/planck2018/{entity.full_path}/bandpass")
+        is data_file
+    )
+
+    release = db.query_release("planck2018")
+    data_files = release.fetch_data_files(db, track=False)
+    assert data_files.keys() == release.data_files
+    assert data_files[uuid] is data_file
 
-def test_entry_hierarchy():
-    db = load_mock_database()
+
+def test_entry_hierarchy(mock_db):
+    db = mock_db
 
     # This is the "27M" entity
     uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
@@ -110,41 +143,50 @@ def test_entry_hierarchy():
     # Check that the parent is the "frequency_030_ghz" entity
     assert child_entity.parent == UUID("b3386894-40a3-4664-aaf6-f78d944943e2")
 
+    # Check that the link is bidirectional
+    parent_entity = db.query_entity(child_entity.parent)
+    assert uuid in parent_entity.children
+    assert not child_entity.children
+
+    # Sets of UUIDs are read-only
+    assert isinstance(parent_entity.children, frozenset)
+    assert isinstance(child_entity.quantities, frozenset)
 
-def test_schema_formats():
-    for folder_name in [
+
+@pytest.mark.parametrize(
+    "folder_name",
+    [
         "mock_db_json",
         "mock_db_json_gz",
         "mock_db_yaml",
         "mock_db_yaml_gz",
         Path("mock_db_json") / "schema.json",  # Explicit file name
         Path("mock_db_json_gz") / "schema.json.gz",  # Explicit file name
-    ]:
-        print(f"Testing {folder_name}")
-        mock_db_path = Path(__file__).parent / folder_name
-        db = LocalInsDb(storage_path=mock_db_path)
+    ],
+)
+def test_schema_formats(folder_name):
+    mock_db_path = TEST_DIR / folder_name
+    db = LocalInsDb(storage_path=mock_db_path)
 
-        # This is the "27M" entity
-        uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
-        child_entity = db.query_entity(uuid)
+    # This is the "27M" entity
+    uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
+    child_entity = db.query_entity(uuid)
 
-        # Check that the parent is the "frequency_030_ghz" entity
-        assert child_entity.parent == UUID("b3386894-40a3-4664-aaf6-f78d944943e2")
+    # Check that the parent is the "frequency_030_ghz" entity
+    assert child_entity.parent == UUID("b3386894-40a3-4664-aaf6-f78d944943e2")
 
 
 def test_uncommon_schema_name():
-    path = Path(__file__).parent / "mock_db_json_3" / "really_weird_name.json"
+    path = TEST_DIR / "mock_db_json_3" / "really_weird_name.json"
     db = LocalInsDb(storage_path=path)
     assert db.storage_path == path.parent
 
 
-def test_missing_data_files():
-    mock_db_path = Path(__file__).parent / "mock_db_json"
-    db = LocalInsDb(storage_path=mock_db_path)
+def test_missing_data_files(mock_db):
     # This folder does contain data files…
-    assert db.are_data_files_available
+    assert mock_db.are_data_files_available
 
-    mock_db_path = Path(__file__).parent / "mock_db_json_3" / "really_weird_name.json"
+    mock_db_path = TEST_DIR / "mock_db_json_3" / "really_weird_name.json"
     db = LocalInsDb(storage_path=mock_db_path)
     # … but this folder does not
     assert not db.are_data_files_available
@@ -159,12 +201,85 @@ def test_missing_data_files():
             pass
 
 
-def test_merge():
-    db = load_mock_database()
-    db.merge(LocalInsDb(Path(__file__).parent / "mock_db_json_2"))
+def test_merge(new_mock_db):
+    # Do not use the `mock_db` fixture, as this test modifies the database
+    db = new_mock_db
+    db.merge(LocalInsDb(TEST_DIR / "mock_db_json_2"))
 
     # This UUID is present in the *first* database
     assert db.query_entity(UUID("8734a013-4184-412c-ab5a-963388beae34"))
 
     # This UUID is present in the *second* database
     assert db.query_entity(UUID("79673fad-adcf-471a-969f-cb0d4a85bd30"))
+
+
+def test_schema_cache(tmp_path, monkeypatch):
+    mock_db_path = MOCK_DB_PATH
+    cache_file = tmp_path / "schema.pkl"
+
+    db = LocalInsDb(storage_path=mock_db_path, cache_file=cache_file)
+    assert cache_file.exists()
+
+    # The second time, the schema must not be parsed again
+    def fail(self, schema):
+        raise AssertionError("the schema cache was not used")
+
+    monkeypatch.setattr(LocalInsDb, "parse_schema", fail)
+    cached_db = LocalInsDb(storage_path=mock_db_path, cache_file=cache_file)
+
+    assert cached_db.entities.keys() == db.entities.keys()
+    assert cached_db.path_to_quantity == db.path_to_quantity
+    data_file = cached_db.query(
+        "/releases/planck2018/LFI/frequency_044_ghz/24M/bandpass"
+    )
+    assert isinstance(data_file, DataFile)
+    assert "planck2018" in data_file.release_tags
+
+
+def test_schema_cache_relative_paths(tmp_path, monkeypatch):
+    cache_file = tmp_path / "schema.pkl"
+    uuid = UUID("ed8ef738-ef1e-474b-b867-646c74f89694")
+
+    # Open the same database through two relative paths: the second one
+    # must not reuse the paths to the data files computed for the first
+    monkeypatch.chdir(TEST_DIR)
+    LocalInsDb(storage_path="mock_db_json", cache_file=cache_file)
+
+    monkeypatch.chdir(TEST_DIR.parent)
+    db = LocalInsDb(
+        storage_path=Path(TEST_DIR.name) / "mock_db_json", cache_file=cache_file
+    )
+    with db.query_data_file(uuid).open_data_file(db) as f:
+        assert f.read(11) == b",wavenumber"
+
+
+def test_numeric_names(tmp_path):
+    # YAML parses unquoted names like `30` as integers
+    (tmp_path / "schema.yaml").write_text(
+        """
+entities:
+  - uuid: 8734a013-4184-412c-ab5a-963388beae34
+    name: 30
+quantities:
+  - uuid: 6d1d72ac-ad22-4e94-9ff4-4c3fa8d47c53
+    name: 12
+    entity: 8734a013-4184-412c-ab5a-963388beae34
+"""
+    )
+    db = LocalInsDb(storage_path=tmp_path)
+
+    entity = db.query_entity("/30")
+    assert entity.name == "30"
+    assert db.query_quantity("/30/12").name == "12"
+
+
+def test_lazy_paths_on_classes(fresh_mock_db):
+    # Tools like Sphinx read the attributes through the class
+    from libinsdb.objects import _LazyPath
+
+    assert isinstance(DataFile.data_file_local_path, _LazyPath)
+
+    data_file = fresh_mock_db.query_data_file(
+        UUID("ed8ef738-ef1e-474b-b867-646c74f89694")
+    )
+    assert isinstance(data_file.data_file_local_path, Path)
@@ -3,7 +3,19 @@
 import datetime
 import io
 from uuid import UUID
-from libinsdb import Entity, Quantity, DataFile, Release, RemoteInsDb
+
+import pytest
+import requests
+
+import libinsdb.remote
+from libinsdb import (
+    Entity,
+    Quantity,
+    DataFile,
+    Release,
+    RemoteInsDb,
+    InstrumentDbConnectionError,
+)
 
 
 def match_authentication(request, username, password):
@@ -36,12 +48,78 @@ def configure_connection(requests_mock) -> RemoteInsDb:
     return connection
 
 
-def test_connection(requests_mock):
-    connection = configure_connection(requests_mock)
+@pytest.fixture
+def connection(requests_mock) -> RemoteInsDb:
+    return configure_connection(requests_mock)
+
+
+def test_connection(connection):
     assert connection.server_address == "http://localhost"
     assert "Authorization" in connection.auth_header
 
 
+def test_custom_session(requests_mock):
+    create_mock_login(requests_mock=requests_mock, username="test", password="12345")
+    session = requests.Session()
+    connection = RemoteInsDb(
+        server_address="http://localhost",
+        username="test",
+        password="12345",
+        session=session,
+    )
+
+    assert connection.session is session
+
+    # The token must not leak to other hosts contacted through the session
+    assert "Authorization" not in session.headers
+    requests_mock.get("http://example.com/")
+    session.get("http://example.com/")
+    assert "Authorization" not in requests_mock.last_request.headers
+
+    configure_mock_entity(requests_mock)
+    connection.query_entity(UUID("8734a013-4184-412c-ab5a-963388beae34"))
+    assert (
+        requests_mock.last_request.headers["Authorization"]
+        == connection.auth_header["Authorization"]
+    )
+
+    # The session belongs to the caller, so it must be left open
+    closed = []
+    session.close = lambda: closed.append(True)
+    connection.close()
+    assert not closed
+
+
+def test_token_host_matching(requests_mock):
+    create_mock_login(requests_mock=requests_mock, username="test", password="12345")
+
+    # Host names are case-insensitive, and requests lowercases them
+    connection = RemoteInsDb(
+        server_address="http://LocalHost", username="test", password="12345"
+    )
+    configure_mock_entity(requests_mock)
+    connection.query_entity(UUID("8734a013-4184-412c-ab5a-963388beae34"))
+    token = connection.auth_header["Authorization"]
+    assert requests_mock.last_request.headers["Authorization"] == token
+
+    # Download links might use another scheme, e.g., behind a proxy…
+    requests_mock.get("https://localhost/browse/")
+    connection.session.get("https://localhost/browse/", auth=connection._auth)
+    assert requests_mock.last_request.headers["Authorization"] == token
+
+    # …but a different port is a different server
+    requests_mock.get("http://localhost:8080/browse/")
+    connection.session.get("http://localhost:8080/browse/", auth=connection._auth)
+    assert "Authorization" not in requests_mock.last_request.headers
+
+
+def test_context_manager(connection):
+    with connection as conn:
+        assert conn is connection
+        adapter = connection.session.get_adapter("http://localhost")
+        assert adapter.max_retries.total > 0
+
+
 def configure_mock_entity(requests_mock) -> None:
     requests_mock.get(
         "http://localhost/api/entities/8734a013-4184-412c-ab5a-963388beae34/",
@@ -66,15 +144,96 @@ def check_entity(entity: Entity, uuid: UUID) -> None:
     assert entity.parent == UUID("b3386894-40a3-4664-aaf6-f78d944943e2")
 
 
-def test_query_entity(requests_mock):
-    connection = configure_connection(requests_mock)
-
+def test_query_entity(connection, requests_mock):
     configure_mock_entity(requests_mock)
     uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
     entity = connection.query_entity(uuid)
 
     check_entity(entity=entity, uuid=uuid)
 
+    # The session must send the token along with every request
+    assert requests_mock.last_request.headers["Authorization"] == (
+        "Token d5469e1b0287b28874c34863e7d54179e998758c"
+    )
+
+
+def test_query_entity_from_tree(connection, requests_mock):
+    uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
+    requests_mock.get(
+        "http://localhost/tree/LFI/frequency_030_ghz/27M",
+        json={
+            "uuid": str(uuid),
+            "url": f"http://localhost/api/entities/{uuid}/",
+            "name": "27M",
+            "parent": "http://localhost/api/entities/b3386894-40a3-4664-aaf6-f78d944943e2/",
+            "children": [],
+            "quantities": [
+                "http://localhost/api/quantities/6d1d72ac-ad22-4e94-9ff4-4c3fa8d47c53/"
+            ],
+        },
+    )
+
+    # The entity must be built from the response of /tree, without
+    # querying /api/entities
+    num_of_requests = requests_mock.call_count
+    entity = connection.query_entity("/LFI/frequency_030_ghz/27M")
+    check_entity(entity=entity, uuid=uuid)
+    assert requests_mock.call_count == num_of_requests + 1
+
+
+def test_conditional_requests(connection, requests_mock):
+    configure_mock_entity(requests_mock)
+    uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
+    requests_mock.get(
+        "http://localhost/tree/LFI/frequency_030_ghz/27M",
+        [
+            {"json": {"uuid": str(uuid)}, "headers": {"ETag": '"1234"'}},
+            {"status_code": 304},
+        ],
+    )
+
+    check_entity(
+        entity=connection.query_entity("/LFI/frequency_030_ghz/27M"), uuid=uuid
+    )
+
+    # The second time, the server replies that the object has not changed
+    check_entity(
+        entity=connection.query_entity("/LFI/frequency_030_ghz/27M"), uuid=uuid
+    )
+    assert requests_mock.last_request.headers["If-None-Match"] == '"1234"'
+
+
+def test_conditional_requests_cache_size(connection, requests_mock, monkeypatch):
+    monkeypatch.setattr(libinsdb.remote, "_MAX_ETAG_CACHE_SIZE", 2)
+    for idx in range(3):
+        requests_mock.get(
+            f"http://localhost/api/test/{idx}/",
+            json={"value": idx},
+            headers={"ETag": f'"{idx}"'},
+        )
+        connection._get_json(f"http://localhost/api/test/{idx}/")
+
+    # Only the most recent responses are kept
+    assert list(connection._etag_cache) == [
+        "http://localhost/api/test/1/",
+        "http://localhost/api/test/2/",
+    ]
+
+
+def test_query_missing_entity(connection, requests_mock):
+    uuid = UUID("8734a013-4184-412c-ab5a-963388beae34")
+    requests_mock.get(
+        f"http://localhost/api/entities/{uuid}/",
+        status_code=404,
+        text="Not found",
+    )
+
+    with pytest.raises(InstrumentDbConnectionError) as exc_info:
+        connection.query_entity(uuid)
+
+    assert exc_info.value.http_code == 404
+    assert exc_info.value.message == "Not found"
+
 
 def configure_mock_quantity(requests_mock) -> None:
     requests_mock.get(
@@ -89,6 +248,7 @@ def configure_mock_quantity(requests_mock) -> None:
                 "http://localhost/api/data_files/ed8ef738-ef1e-474b-b867-646c74f89694/",
             ],
         },
+        headers={"ETag": '"5678"'},
     )
 
 
@@ -101,14 +261,38 @@ def check_quantity(quantity: Quantity, uuid: UUID) -> None:
     assert quantity.format_spec == UUID("e406caf2-95c0-4e18-8980-a86934479423")
 
 
-def test_query_quantity(requests_mock):
-    connection = configure_connection(requests_mock)
+def test_query_quantity(connection, requests_mock):
     configure_mock_quantity(requests_mock)
 
     uuid = UUID("6d1d72ac-ad22-4e94-9ff4-4c3fa8d47c53")
     quantity = connection.query_quantity(uuid)
     check_quantity(quantity=quantity, uuid=uuid)
 
+    # The second query must be served from the cache
+    num_of_requests = requests_mock.call_count
+    assert connection.query_quantity(uuid) is quantity
+    assert requests_mock.call_count == num_of_requests
+
+    connection.clear_cache()
+    check_quantity(quantity=connection.query_quantity(uuid), uuid=uuid)
+    assert requests_mock.call_count == num_of_requests + 1
+
+
+def test_conditional_requests_after_clear_cache(connection, requests_mock):
+    configure_mock_quantity(requests_mock)
+    uuid = UUID("6d1d72ac-ad22-4e94-9ff4-4c3fa8d47c53")
+    connection.query_quantity(uuid)
+
+    # Once the cache is cleared, the server is asked whether the
+    # quantity has changed instead of sending it again
+    connection.clear_cache()
+    requests_mock.get(
+        f"http://localhost/api/quantities/{uuid}/",
+        status_code=304,
+    )
+    check_quantity(quantity=connection.query_quantity(uuid), uuid=uuid)
+    assert requests_mock.last_request.headers["If-None-Match"] == '"5678"'
+
 
 def configure_mock_data_file(requests_mock) -> None:
     requests_mock.get(
@@ -151,23 +335,31 @@ def check_data_file(data_file: DataFile, uuid: UUID) -> None:
     assert data_file.uuid == uuid
     assert data_file.name == "bandpass_detector_27M.csv"
     assert data_file.quantity == UUID("6d1d72ac-ad22-4e94-9ff4-4c3fa8d47c53")
+    assert data_file.upload_date == datetime.datetime(
+        2017, 9, 26, tzinfo=datetime.timezone.utc
+    )
     assert data_file.metadata is None
     assert len(data_file.release_tags) == 1
     assert "planck2018" in data_file.release_tags
 
 
-def test_query_data_file(requests_mock):
-    connection = configure_connection(requests_mock)
+def test_query_data_file(connection, requests_mock):
     configure_mock_data_file(requests_mock)
 
     uuid = UUID("ed8ef738-ef1e-474b-b867-646c74f89694")
-    data_file = connection.query_data_file(uuid)
+    data_file = connection.query_data_file(uuid, track=False)
     check_data_file(data_file=data_file, uuid=uuid)
+    assert uuid not in connection.get_queried_data_files()
 
+    # The second query must be served from the cache, but it must be
+    # tracked nevertheless
+    num_of_requests = requests_mock.call_count
+    assert connection.query_data_file(str(uuid)) is data_file
+    assert requests_mock.call_count == num_of_requests
+    assert uuid in connection.get_queried_data_files()
 
-def test_metadata(requests_mock):
-    connection = configure_connection(requests_mock)
 
+def test_metadata(connection, requests_mock):
     requests_mock.get(
         "http://localhost/api/data_files/25109593-c5e2-4b60-b06e-ac5e6c3b7b83/",
         json={
@@ -306,21 +498,24 @@ def check_release(release: Release, tag: str) -> None:
     assert (
         release.comment == "Instrument specification for the Planck 2018 data release"
     )
+    assert isinstance(release.data_files, frozenset)
     assert len(release.data_files) == 36
     assert UUID("25109593-c5e2-4b60-b06e-ac5e6c3b7b83") in release.data_files
 
 
-def test_query_release(requests_mock):
-    connection = configure_connection(requests_mock)
-
+def test_query_release(connection, requests_mock):
     configure_mock_release(requests_mock)
     release = connection.query_release(tag="planck2018")
 
     check_release(release=release, tag="planck2018")
 
+    # The second query must be served from the cache
+    num_of_requests = requests_mock.call_count
+    assert connection.query_release(tag="planck2018") is release
+    assert requests_mock.call_count == num_of_requests
 
-def test_download_file(requests_mock):
-    connection = configure_connection(requests_mock)
+
+def test_download_file(connection, requests_mock):
     configure_mock_data_file(requests_mock)
 
     uuid = UUID("ed8ef738-ef1e-474b-b867-646c74f89694")
@@ -329,9 +524,7 @@ def test_download_file(requests_mock):
         assert f.read(11) == b",wavenumber"
 
 
-def test_create_objects(requests_mock):
-    connection = configure_connection(requests_mock)
-
+def test_create_objects(connection, requests_mock):
     entity_response = {
         "uuid": "5a25b116-784e-4013-8f60-2f31b4190ec3",
         "url": "http://localhost/api/entities/5a25b116-784e-4013-8f60-2f31b4190ec3/",
@@ -365,7 +558,7 @@ def test_create_objects(requests_mock):
             "quantities": [],
         },
     )
-    sub_root_entity = connection.create_entity(name="sub_root", parent_path="root")
+    sub_root_entity = connection.create_entity(name="sub_root", parent_path="/root/")
     assert (
         sub_root_entity
         == "http://localhost/api/entities/44fc0e18-fbeb-4387-953c-68bfd11900e1/"
@@ -0,0 +1,8 @@
+# -*- encoding: utf-8 -*-
+
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+
+# The database used by most of the tests
+MOCK_DB_PATH = TEST_DIR / "mock_db_json"